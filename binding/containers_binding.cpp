@@ -3,16 +3,21 @@
  * @brief Python bindings for the containers module
  */
 
+#include <algorithm>
+#include <cstddef>
 #include <format>
 #include <functional>
 #include <initializer_list>
 #include <ranges>
+#include <span>
 #include <string>
 #include <string_view>
+#include <type_traits>
 #include <utility>
 #include <vector>
 
 #include <pybind11/attr.h>
+#include <pybind11/cast.h>
 #include <pybind11/detail/common.h>
 #include <pybind11/functional.h>
 #include <pybind11/pybind11.h>
@@ -30,10 +35,16 @@ using cpp_features::concepts::TransformFunction;
 
 namespace {
 
+// Negative indices count from the end, as with Python sequences
 template <CopyableType T>
-auto GetItem(const Container<T> &self, typename Container<T>::size_type index) -> T {
-  if (auto result = self.At(index); result) {
-    return result->get();
+auto GetItem(const Container<T> &self, py::ssize_t index) -> T {
+  if (index < 0) {
+    index += static_cast<py::ssize_t>(self.GetSize());
+  }
+  if (index >= 0) {
+    if (auto result = self.At(static_cast<typename Container<T>::size_type>(index)); result) {
+      return result->get();
+    }
   }
   throw py::index_error("Index out of bounds");
 }
@@ -44,13 +55,55 @@ auto GetFilteredWrapper(const Container<T> &self, const std::function<bool(T)> &
   return std::ranges::to<std::vector>(std::move(filtered_view));
 }
 
+// Call the Python callable through vectorcall, which runs builtins such as len or str without
+// building an argument tuple, and skips the GIL re-acquisition of a std::function wrapper
 template <typename Input>
-auto GetTransformWrapper(const Container<Input> &self,
-                         const std::function<py::object(Input)> &transform) {
-  auto transformed_view = self.template GetTransformedView<py::object>(transform);
+auto GetTransformWrapper(const Container<Input> &self, const py::function &transform) {
+  auto transformed_view =
+      self.template GetTransformedView<py::object>([&transform](const Input &value) {
+        const auto arg = py::cast(value);
+        auto *result = PyObject_CallOneArg(transform.ptr(), arg.ptr());
+        if (result == nullptr) {
+          throw py::error_already_set();
+        }
+        return py::reinterpret_steal<py::object>(result);
+      });
   return std::ranges::to<std::vector>(std::move(transformed_view));
 }
 
+// Copy a matching contiguous buffer (e.g. array.array) in one pass, otherwise convert per element
+template <CopyableType T>
+auto FromBuffer(const py::buffer &buffer) -> Container<T> {
+  const auto info = buffer.request();
+  if (info.ndim != 1 || info.format != py::format_descriptor<T>::format() ||
+      info.strides[0] != info.itemsize) {
+    return Container<T>{py::list(buffer).cast<std::vector<T>>()};
+  }
+  return Container<T>{
+      std::span{static_cast<const T *>(info.ptr), static_cast<std::size_t>(info.size)}};
+}
+
+// Load the item without lossy conversions, so it is found only if it equals an element as a
+// Python value. Integral elements accept integers alone (Fraction(5, 2) is not truncated to 2),
+// floating elements also accept int. Anything else is never contained
+template <CopyableType T>
+auto Contains(const Container<T> &self, const py::handle &item) -> bool {
+  bool convert = false;
+  if constexpr (std::is_floating_point_v<T>) {
+    convert = py::isinstance<py::int_>(item);
+  }
+  py::detail::make_caster<T> caster;
+  if (!caster.load(item, convert)) {
+    return false;
+  }
+  return std::ranges::find(self, py::detail::cast_op<const T &>(caster)) != self.end();
+}
+
+template <CopyableType T>
+auto IsEqual(const Container<T> &self, const std::vector<T> &other) -> bool {
+  return std::ranges::equal(self, other);
+}
+
 template <CopyableType T>
 auto GetIter(const Container<T> &self) {
   return py::make_iterator(self.begin(), self.end());
@@ -62,11 +115,29 @@ auto GetRepr(const Container<T> &self, std::string_view class_name) {
                      static_cast<const void *>(&self));
 }
 
+// Numeric containers expose their storage through the buffer protocol, so memoryview and
+// NumPy can read the elements without copying or calling back per element
+template <typename T>
+auto MakeContainerClass(py::module &m, const std::string &class_name) {
+  if constexpr (std::is_arithmetic_v<T>) {
+    return py::class_<Container<T>>(m, class_name.c_str(), py::buffer_protocol())
+        .def(py::init(&FromBuffer<T>))
+        .def_buffer([](Container<T> &self) {
+          return py::buffer_info(std::ranges::data(self), static_cast<py::ssize_t>(sizeof(T)),
+                                 py::format_descriptor<T>::format(), 1,
+                                 {static_cast<py::ssize_t>(self.GetSize())},
+                                 {static_cast<py::ssize_t>(sizeof(T))}, true);
+        });
+  } else {
+    return py::class_<Container<T>>(m, class_name.c_str());
+  }
+}
+
 // Template function to register container bindings for a specific type
 template <typename T>
 void BindContainerFor(py::module &m, std::string_view type_name) {
   auto class_name = std::format("{}Container", type_name);
-  py::class_<Container<T>>(m, class_name.c_str())
+  MakeContainerClass<T>(m, class_name)
       .def(py::init<>())
       .def(py::init<typename Container<T>::size_type>())
       .def(py::init<std::initializer_list<T>>())
@@ -79,9 +150,17 @@ void BindContainerFor(py::module &m, std::string_view type_name) {
       .def("view", &Container<T>::GetView)
       .def("filter", &GetFilteredWrapper<T>)
       .def("transform", &GetTransformWrapper<T>)
+      .def("to_list",
+           [](const Container<T> &self) { return std::ranges::to<std::vector>(self.GetView()); })
       .def("__len__", &Container<T>::GetSize)
       .def("__bool__", [](const Container<T> &self) { return !self.IsEmpty(); })
       .def("__getitem__", &GetItem<T>)
+      .def("__contains__", &Contains<T>)
+      .def(
+          "__eq__",
+          [](const Container<T> &self, const Container<T> &other) { return self == other; },
+          py::is_operator())
+      .def("__eq__", &IsEqual<T>, py::is_operator())
       .def("__iter__", &GetIter<T>, py::keep_alive<0, 1>())
       .def("__str__", [](const Container<T> &self) { return std::format("{}", self); })
       .def("__repr__",
@@ -57,7 +57,7 @@ auto TranslateExceptions(std::exception_ptr p) {
   } catch (const BaseException &e) {
     auto m = py::module_::import("demo.exceptions");
     auto severity_cls = m.attr("ErrorSeverity");
-    py::object severity = severity_cls(e.GetSeverity());
+    py::object severity = severity_cls(py::int_{std::to_underlying(e.GetSeverity())});
     TranslateException(e, "BaseException", std::move(severity));
   }
 }
@@ -3,11 +3,16 @@
  * @brief Python bindings for the random module
  */
 
+#include <algorithm>
+#include <concepts>
 #include <cstddef>
 #include <cstdint>
 #include <format>
+#include <numeric>
 #include <ranges>
+#include <span>
 #include <string>
+#include <vector>
 
 #include <pybind11/pybind11.h>
 #include <pybind11/stl.h>
@@ -26,6 +31,51 @@ auto SampleFromRangeWrapper(const Range &range, std::size_t count) {
   return SampleFromRange(range, count);
 }
 
+// Index-based helpers let Python lists of any element type be shuffled or sampled in C++
+auto Permutation(std::size_t size) {
+  std::vector<std::size_t> indices(size);
+  std::iota(indices.begin(), indices.end(), std::size_t{0});
+  ShuffleContainer(indices);
+  return indices;
+}
+
+auto SampleIndices(std::size_t size, std::size_t count) {
+  return SampleFromRange(std::views::iota(std::size_t{0}, size), count);
+}
+
+// Typed buffers such as array.array are filled in place, so no Python object is created per value
+template <typename T>
+auto AsWritableSpan(const py::buffer_info &info) -> std::span<T> {
+  if (info.readonly || info.ndim != 1 || info.format != py::format_descriptor<T>::format() ||
+      info.strides[0] != info.itemsize) {
+    throw py::type_error(std::format("Expected a writable contiguous buffer of format '{}'",
+                                     py::format_descriptor<T>::format()));
+  }
+  return {static_cast<T *>(info.ptr), static_cast<std::size_t>(info.size)};
+}
+
+template <std::integral T>
+void FillInts(RandomGenerator &self, const py::buffer &out, T min_val, T max_val) {
+  const auto info = out.request(true);
+  auto values = AsWritableSpan<T>(info);
+  std::ranges::generate(values, [&] { return self.GenerateInt(min_val, max_val); });
+}
+
+template <std::floating_point T>
+void FillFloats(RandomGenerator &self, const py::buffer &out, T min_val, T max_val) {
+  const auto info = out.request(true);
+  auto values = AsWritableSpan<T>(info);
+  std::ranges::generate(values, [&] { return self.GenerateReal(min_val, max_val); });
+}
+
+// Normal distributions keep state between draws, so copy one batch to match normals() exactly
+template <std::floating_point T>
+void FillNormals(RandomGenerator &self, const py::buffer &out, T mean, T stddev) {
+  const auto info = out.request(true);
+  auto values = AsWritableSpan<T>(info);
+  std::ranges::copy(self.GenerateNormalVector(mean, stddev, values.size()), values.begin());
+}
+
 }  // namespace
 
 void BindRandom(py::module &m) {
@@ -33,13 +83,22 @@ void BindRandom(py::module &m) {
   py::class_<RandomGenerator>(m, "RandomGenerator")
       .def(py::init<>())
       .def(py::init<std::uint32_t>())
-      .def("rand_int", &RandomGenerator::GenerateInt<std::int64_t>)
-      .def("rand_float", &RandomGenerator::GenerateReal<double>)
+      .def("rand_int", &RandomGenerator::GenerateInt<std::int64_t>, py::arg("min_val"),
+           py::arg("max_val"))
+      .def("rand_float", &RandomGenerator::GenerateReal<double>, py::arg("min_val"),
+           py::arg("max_val"))
+      // Batch calls keep the GIL held, as it is what serializes access to the shared engine
       .def("rand_ints", &RandomGenerator::GenerateIntVector<int>)
       .def("rand_floats", &RandomGenerator::GenerateRealVector<double>)
-      .def("rand_bool", &RandomGenerator::GenerateBool)
-      .def("normal", &RandomGenerator::GenerateNormal<double>)
-      .def("seed", &RandomGenerator::Seed)
+      .def("fill_ints", &FillInts<int>)
+      .def("fill_floats", &FillFloats<double>)
+      .def("rand_bool", &RandomGenerator::GenerateBool, py::arg("probability") = 0.5)
+      .def("rand_bools", &RandomGenerator::GenerateBoolVector)
+      .def("normal", &RandomGenerator::GenerateNormal<double>, py::arg("mean") = 0.0,
+           py::arg("stddev") = 1.0)
+      .def("normals", &RandomGenerator::GenerateNormalVector<double>)
+      .def("fill_normals", &FillNormals<double>)
+      .def("seed", &RandomGenerator::Seed, py::arg("seed"))
       .def("seed_with_time", &RandomGenerator::SeedWithTime)
       .def("__repr__", [](const RandomGenerator &self) {
         return std::format("<RandomGenerator at {}>", static_cast<const void *>(&self));
@@ -53,4 +112,7 @@ void BindRandom(py::module &m) {
   m.def("sample", &SampleFromRangeWrapper<Container<int>>);
   m.def("sample", &SampleFromRangeWrapper<Container<double>>);
   m.def("sample", &SampleFromRangeWrapper<Container<std::string>>);
+
+  m.def("permutation", &Permutation);
+  m.def("sample_indices", &SampleIndices);
 }
@@ -3,12 +3,20 @@
  * @brief Python bindings for the shapes module
  */
 
+#include <cstddef>
 #include <format>
+#include <functional>
 #include <memory>
+#include <ranges>
+#include <span>
 #include <string>
+#include <utility>
+#include <vector>
 
+#include <pybind11/buffer_info.h>
 #include <pybind11/pybind11.h>
 #include <pybind11/pytypes.h>
+#include <pybind11/stl.h>
 
 #include "shapes/circle.hpp"
 #include "shapes/rectangle.hpp"
@@ -17,6 +25,70 @@
 namespace py = pybind11;
 using namespace cpp_features::shapes;
 
+namespace {
+
+// Batch shapes keep their dimensions in array('d') buffers, which are read in place
+auto RequestDoubles(const py::buffer &buffer) -> py::buffer_info {
+  auto info = buffer.request();
+  if (info.ndim != 1 || info.format != py::format_descriptor<double>::format() ||
+      info.strides[0] != info.itemsize) {
+    throw py::type_error("Expected a contiguous buffer of format 'd'");
+  }
+  return info;
+}
+
+auto AsSpan(const py::buffer_info &info) -> std::span<const double> {
+  return {static_cast<const double *>(info.ptr), static_cast<std::size_t>(info.size)};
+}
+
+// Widths and heights are read pairwise, so both buffers must have the same length
+auto RequestDimensions(const py::buffer &widths, const py::buffer &heights)
+    -> std::pair<py::buffer_info, py::buffer_info> {
+  auto width_info = RequestDoubles(widths);
+  auto height_info = RequestDoubles(heights);
+  if (width_info.size != height_info.size) {
+    throw py::value_error("Widths and heights must have the same length");
+  }
+  return {std::move(width_info), std::move(height_info)};
+}
+
+// Every batch value goes through the single-shape class, so formulas and validation are shared.
+// Validation constructs each shape in turn and keeps nothing
+void ValidateCircles(const py::buffer &radii) {
+  const auto info = RequestDoubles(radii);
+  for (const double radius : AsSpan(info)) {
+    [[maybe_unused]] const Circle circle{radius};
+  }
+}
+
+template <typename Measure>
+auto MeasureCircles(const py::buffer &radii, Measure measure) -> std::vector<double> {
+  const auto info = RequestDoubles(radii);
+  return std::ranges::to<std::vector>(AsSpan(info) | std::views::transform([&](double radius) {
+                                        return std::invoke(measure, Circle{radius});
+                                      }));
+}
+
+void ValidateRectangles(const py::buffer &widths, const py::buffer &heights) {
+  const auto [width_info, height_info] = RequestDimensions(widths, heights);
+  for (const auto [width, height] : std::views::zip(AsSpan(width_info), AsSpan(height_info))) {
+    [[maybe_unused]] const Rectangle rectangle{width, height};
+  }
+}
+
+template <typename Measure>
+auto MeasureRectangles(const py::buffer &widths, const py::buffer &heights, Measure measure)
+    -> std::vector<double> {
+  const auto [width_info, height_info] = RequestDimensions(widths, heights);
+  return std::ranges::to<std::vector>(std::views::zip(AsSpan(width_info), AsSpan(height_info)) |
+                                      std::views::transform([&](const auto &dimensions) {
+                                        const auto [width, height] = dimensions;
+                                        return std::invoke(measure, Rectangle{width, height});
+                                      }));
+}
+
+}  // namespace
+
 void BindShapes(py::module &m) {
   // Bind the abstract Shape base class
   py::class_<Shape, std::shared_ptr<Shape>>(m, "Shape")
@@ -64,4 +136,18 @@ void BindShapes(py::module &m) {
         return std::format("<Rectangle(width={:.2f}, height={:.2f}) at {}>", r.GetWidth(),
                            r.GetHeight(), static_cast<const void *>(&r));
       });
+
+  // Bind batch calculations over dimension buffers
+  m.def("validate_circles", &ValidateCircles);
+  m.def("circle_areas",
+        [](const py::buffer &radii) { return MeasureCircles(radii, &Circle::GetArea); });
+  m.def("circle_perimeters",
+        [](const py::buffer &radii) { return MeasureCircles(radii, &Circle::GetPerimeter); });
+  m.def("validate_rectangles", &ValidateRectangles);
+  m.def("rectangle_areas", [](const py::buffer &widths, const py::buffer &heights) {
+    return MeasureRectangles(widths, heights, &Rectangle::GetArea);
+  });
+  m.def("rectangle_perimeters", [](const py::buffer &widths, const py::buffer &heights) {
+    return MeasureRectangles(widths, heights, &Rectangle::GetPerimeter);
+  });
 }
@@ -63,5 +63,6 @@ void BindTiming(py::module &m) {
 
   // Bind utility functions
   m.def("to_human_readable", &ToHumanReadable);
-  m.def("time_function", &TimeFunctionWrapper);
+  m.def("time_function", &TimeFunctionWrapper, py::arg("func"),
+        "Time a single function execution, returning the elapsed time in nanoseconds.");
 }
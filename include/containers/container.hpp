@@ -22,6 +22,7 @@
 #include <string>
 #include <string_view>
 #include <type_traits>
+#include <utility>
 #include <vector>
 
 #include "concepts/callable_concepts.hpp"
@@ -100,6 +101,20 @@ class Container {
    */
   Container(std::initializer_list<T> init) : data_(init) {}
 
+  /**
+   * @brief Construct container by taking over a vector
+   *
+   * @param data Vector whose elements become the container's elements
+   *
+   * Adopts the vector's storage instead of copying element by element, so passing an rvalue
+   * constructs the container without reallocating.
+   *
+   * @code
+   * Container<std::string> words(std::vector<std::string>{"hello", "world"});
+   * @endcode
+   */
+  explicit Container(std::vector<T> data) noexcept : data_(std::move(data)) {}
+
   /**
    * @brief Construct container from any input range
    *
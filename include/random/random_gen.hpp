@@ -206,6 +206,35 @@ class RandomGenerator {
     return dist(generator_);
   }
 
+  /**
+   * @brief Generate a vector of random boolean values with specified probability
+   *
+   * @param probability Probability of each value being true
+   * @param count Number of random values to generate
+   * @return A vector of random boolean values
+   *
+   * Efficiently generates a vector of independent Bernoulli trials, validating the probability
+   * once for the whole batch.
+   *
+   * @code
+   * auto coin_flips = generator.GenerateBoolVector(0.5, 100);
+   * @endcode
+   */
+  [[nodiscard]] auto GenerateBoolVector(double probability, std::size_t count)
+      -> std::vector<bool> {
+    if (probability < 0.0 || probability > 1.0) {
+      throw std::invalid_argument("Probability must be between 0.0 and 1.0");
+    }
+    std::vector<bool> result;
+    result.reserve(count);
+    std::bernoulli_distribution dist{probability};
+
+    for (std::size_t i = 0; i < count; ++i) {
+      result.push_back(dist(generator_));
+    }
+    return result;
+  }
+
   /**
    * @brief Generate a random value from a normal (Gaussian) distribution
    *
@@ -230,6 +259,35 @@ class RandomGenerator {
     return dist(generator_);
   }
 
+  /**
+   * @brief Generate a vector of values from a normal (Gaussian) distribution
+   *
+   * @tparam T Floating-point type that satisfies std::floating_point concept
+   * @param mean Mean (center) of the distribution
+   * @param stddev Standard deviation of the distribution
+   * @param count Number of random values to generate
+   * @return A vector of random values from the normal distribution
+   *
+   * Efficiently generates a vector of normally distributed random values, reusing a single
+   * distribution object for the whole batch.
+   *
+   * @code
+   * auto noise = generator.GenerateNormalVector(0.0, 1.0, 1024);
+   * auto heights = generator.GenerateNormalVector(170.0F, 10.0F, 100);
+   * @endcode
+   */
+  template <std::floating_point T>
+  [[nodiscard]] auto GenerateNormalVector(T mean, T stddev, std::size_t count) -> std::vector<T> {
+    std::vector<T> result;
+    result.reserve(count);
+    std::normal_distribution<T> dist{mean, stddev};
+
+    for (std::size_t i = 0; i < count; ++i) {
+      result.push_back(dist(generator_));
+    }
+    return result;
+  }
+
   /**
    * @brief Manually seed the random number generator
    *
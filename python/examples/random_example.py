@@ -38,15 +38,13 @@ def demonstrate_probability_distributions() -> None:
     print(f'   Uniform reals [0.5, 1.5): {uniform_reals}')
 
     # Normal distribution
-    iq_scores: list[int] = []
-    for _ in range(5):
-        iq_scores.append(int(generator.normal(100.0, 15.0)))
+    iq_scores = [int(score) for score in generator.normals(100.0, 15.0, count=5)]
     print(f'   IQ scores (μ = 100, σ = 15): {iq_scores}')
 
     # Bernoulli distribution
-    coin_flips: list[str] = []
-    for _ in range(10):
-        coin_flips.append('H' if generator.rand_bool(0.7) else 'T')
+    coin_flips = [
+        'H' if heads else 'T' for heads in generator.rand_bools(0.7, count=10)
+    ]
     print(f'   Biased coin flips (p = 0.7): {coin_flips}')
 
 
@@ -99,13 +97,11 @@ def demonstrate_practical_applications() -> None:
     print(f'   Rolling 3 dice: {dice_rolls}, Total: {total}')
 
     # Monte Carlo estimation (simple π approximation)
-    inside_circle = 0
     samples = 10000
-    for _ in range(samples):
-        x = dice_generator.rand_float(-1.0, 1.0)
-        y = dice_generator.rand_float(-1.0, 1.0)
-        if x * x + y * y <= 1.0:
-            inside_circle += 1
+    coords = dice_generator.rand_float_array(-1.0, 1.0, count=2 * samples)
+    inside_circle = sum(
+        x * x + y * y <= 1.0 for x, y in zip(coords[::2], coords[1::2], strict=True)
+    )
 
     pi_estimate = 4.0 * inside_circle / samples
     print(f'   Monte Carlo π estimation ({samples} samples): {pi_estimate:.3f}')
@@ -1,6 +1,6 @@
 """Example demonstrating the usage of the shapes module."""
 
-from demo.shapes import Circle, Rectangle, Shape
+from demo.shapes import Circle, CircleArray, Rectangle, RectangleArray, Shape
 
 
 def demonstrate_shape_creation() -> None:
@@ -55,6 +55,19 @@ def demonstrate_shape_comparisons() -> None:
     print(f'   {rect2} == {rect4}')
 
 
+def demonstrate_batch_calculations() -> None:
+    """Demonstrate batch calculations over many shapes at once."""
+    print('\n4. Batch calculations:')
+
+    circles = CircleArray([1.0, 2.5, 5.0])
+    total_area = sum(circles.areas())
+    print(f'   {len(circles)} circles, total area: {total_area:.2f}')
+
+    rectangles = RectangleArray([4.0, 2.0, 5.0], [3.0, 6.0, 5.0])
+    perimeters = ', '.join(f'{p:.2f}' for p in rectangles.perimeters())
+    print(f'   {len(rectangles)} rectangles, perimeters: {perimeters}')
+
+
 def main() -> None:
     """Run all shape examples."""
     print('=== Shapes Module Example ===')
@@ -62,6 +75,7 @@ def main() -> None:
     demonstrate_shape_creation()
     demonstrate_polymorphic_behavior()
     demonstrate_shape_comparisons()
+    demonstrate_batch_calculations()
 
     print('\n=== Shapes Module Example Completed ===')
 
@@ -78,7 +78,7 @@ def count_if(data: Iterable[T], predicate: Callable[[T], bool]) -> int:
         case Container():
             return _algorithms.count_if(data._container, predicate)
         case _:
-            return sum(1 for item in data if predicate(item))
+            return sum(map(bool, map(predicate, data)))
 
 
 def transform_to_list(data: Iterable[T], func: Callable[[T], U]) -> list[U]:
@@ -112,7 +112,7 @@ def transform_to_list(data: Iterable[T], func: Callable[[T], U]) -> list[U]:
         case Container():
             return _algorithms.transform_to_list(data._container, func)
         case _:
-            return [func(item) for item in data]
+            return list(map(func, data))
 
 
 def find_min_max(
@@ -1,7 +1,7 @@
 """Python wrapper for the containers module."""
 
 import builtins
-from collections.abc import Callable, Iterable, Iterator
+from collections.abc import Buffer, Callable, Iterable, Iterator
 from typing import TypeVar
 
 from .cpp_features import containers as _containers
@@ -24,7 +24,8 @@ class Container[T]:
         container_type : type[T]
             The type of elements stored in the container
         data : Iterable[T], optional
-            Initial data to populate the container
+            Initial data to populate the container. Numeric containers copy buffers
+            of a matching type (e.g. ``array('i')`` or ``array('d')``) in one pass.
 
         Examples
         --------
@@ -36,6 +37,7 @@ class Container[T]:
         <StringContainer(size=3) at 0x13911eaa0>
         """
         self._type = container_type
+        self._exports = 0
 
         match container_type:
             case builtins.int:
@@ -49,7 +51,12 @@ class Container[T]:
                     f'Unsupported container type: {container_type.__name__}'
                 )
 
-        self._container = cls(list(data)) if data else cls()
+        if data is None:
+            self._container = cls()
+        elif isinstance(data, Buffer):
+            self._container = cls(data)
+        else:
+            self._container = cls(list(data))
 
     def add(self, item: T) -> None:
         """Add an element to the container.
@@ -61,6 +68,11 @@ class Container[T]:
         item : T
             The element to add
 
+        Raises
+        ------
+        BufferError
+            If a buffer view of the container is alive
+
         Examples
         --------
         >>> container = Container(int, [1, 2, 3])
@@ -68,6 +80,7 @@ class Container[T]:
         >>> list(container)
         [1, 2, 3, 4]
         """
+        self._check_not_exported()
         self._container.add(item)
 
     def remove(self, item: T) -> int:
@@ -86,6 +99,11 @@ class Container[T]:
         int
             The number of elements that were removed
 
+        Raises
+        ------
+        BufferError
+            If a buffer view of the container is alive
+
         Examples
         --------
         >>> container = Container(int, [1, 2, 3, 2, 4, 2])
@@ -94,6 +112,7 @@ class Container[T]:
         >>> list(container)
         [1, 3, 4]
         """
+        self._check_not_exported()
         return self._container.remove(item)
 
     def __len__(self) -> int:
@@ -156,7 +175,8 @@ class Container[T]:
     def __getitem__(self, index: int) -> T:
         """Access the element at specified index.
 
-        Returns the element at the specified index.
+        Returns the element at the specified index. Negative indices count from the
+        end of the container.
 
         Parameters
         ----------
@@ -181,10 +201,31 @@ class Container[T]:
         >>> container[-1]
         3
         """
-        if index < 0:
-            index %= len(self._container)
         return self._container[index]
 
+    def __contains__(self, item: object) -> bool:
+        """Check if the container holds an element equal to the item.
+
+        The search runs in C++ and stops at the first match.
+
+        Parameters
+        ----------
+        item : object
+            The item to search for
+
+        Returns
+        -------
+        bool
+            True if the item is in the container, False otherwise
+
+        Examples
+        --------
+        >>> container = Container(int, [1, 2, 3])
+        >>> 2 in container
+        True
+        """
+        return item in self._container
+
     def filter(self, predicate: Callable[[T], bool]) -> list[T]:
         """Filter container elements.
 
@@ -231,6 +272,100 @@ class Container[T]:
         """
         return self._container.transform(func)
 
+    def to_list(self) -> list[T]:
+        """Copy the container elements into a list.
+
+        Converts all elements in a single call, rather than stepping the iterator
+        once per element as ``list(container)`` does.
+
+        Returns
+        -------
+        list[T]
+            A list of the container elements
+
+        Examples
+        --------
+        >>> container = Container(int, [1, 2, 3])
+        >>> container.to_list()
+        [1, 2, 3]
+        """
+        return self._container.to_list()
+
+    def __buffer__(self, flags: int) -> memoryview:
+        """Expose the elements of a numeric container without copying.
+
+        Returns a read-only view of the underlying storage, so ``memoryview`` and
+        ``numpy.asarray`` can process the elements without per-element callbacks.
+        Like ``bytearray``, the container cannot be resized while a view is alive.
+
+        Parameters
+        ----------
+        flags : int
+            Buffer request flags
+
+        Returns
+        -------
+        memoryview
+            A read-only view of the container elements
+
+        Raises
+        ------
+        TypeError
+            If the container does not hold numeric elements
+
+        Examples
+        --------
+        >>> container = Container(int, [1, 2, 3, 4, 5])
+        >>> memoryview(container).tolist()
+        [1, 2, 3, 4, 5]
+        """
+        view = memoryview(self._container)
+        self._exports += 1
+        return view
+
+    def __release_buffer__(self, view: memoryview) -> None:
+        """Release a view returned by ``__buffer__``.
+
+        Parameters
+        ----------
+        view : memoryview
+            The view to release
+        """
+        self._exports -= 1
+        view.release()
+
+    def _check_not_exported(self) -> None:
+        """Refuse to resize while a view is alive, as it would be left dangling."""
+        if self._exports:
+            raise BufferError('Existing exports of data: container cannot be resized')
+
+    def __eq__(self, other: object) -> bool:
+        """Compare elements with another container or a sequence.
+
+        The comparison runs in C++ without iterating the elements in Python.
+
+        Parameters
+        ----------
+        other : object
+            The container or sequence to compare with
+
+        Returns
+        -------
+        bool
+            True if both hold the same elements in the same order
+
+        Examples
+        --------
+        >>> Container(int, [1, 2, 3]) == [1, 2, 3]
+        True
+        """
+        if isinstance(other, Container):
+            other = other._container
+        return self._container == other
+
+    # Containers are mutable and compare by value, so they are unhashable like lists
+    __hash__ = None  # type: ignore[assignment]
+
     def __str__(self) -> str:
         """String representation."""
         return str(self._container)
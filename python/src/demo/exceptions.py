@@ -1,23 +1,30 @@
 """Python wrapper for the exceptions module."""
 
-from enum import Enum
+from enum import IntEnum
 
 from .cpp_features import exceptions as _exceptions
 
 
-class ErrorSeverity(Enum):
+# The C++ severity names are static, so convert them once instead of on every call
+_SEVERITY_STRINGS = {
+    severity.value: _exceptions.severity_to_string(severity)
+    for severity in _exceptions.ErrorSeverity.__members__.values()
+}
+
+
+class ErrorSeverity(IntEnum):
     """Error severity levels."""
 
-    TRACE = _exceptions.ErrorSeverity.TRACE
-    DEBUG = _exceptions.ErrorSeverity.DEBUG
-    INFO = _exceptions.ErrorSeverity.INFO
-    WARNING = _exceptions.ErrorSeverity.WARNING
-    ERROR = _exceptions.ErrorSeverity.ERROR
-    FATAL = _exceptions.ErrorSeverity.FATAL
+    TRACE = _exceptions.ErrorSeverity.TRACE.value
+    DEBUG = _exceptions.ErrorSeverity.DEBUG.value
+    INFO = _exceptions.ErrorSeverity.INFO.value
+    WARNING = _exceptions.ErrorSeverity.WARNING.value
+    ERROR = _exceptions.ErrorSeverity.ERROR.value
+    FATAL = _exceptions.ErrorSeverity.FATAL.value
 
     def __str__(self) -> str:
         """String representation."""
-        return _exceptions.severity_to_string(self.value)
+        return _SEVERITY_STRINGS[self._value_]
 
 
 class BaseException(Exception):
@@ -1,6 +1,6 @@
 """Python wrapper for the random module."""
 
-import random
+from array import array
 from typing import TypeVar
 
 from .containers import Container
@@ -9,6 +9,8 @@ from .cpp_features import random as _random
 
 T = TypeVar('T')
 
+_NORMAL_BUFFER_SIZE = 1024
+
 
 class RandomGenerator:
     """A random number generator."""
@@ -33,6 +35,10 @@ class RandomGenerator:
         else:
             self._generator = _random.RandomGenerator()
 
+        # Standard normal values drawn in batches from C++ and served by normal()
+        self._normal_buffer: list[float] = []
+        self._normal_index = 0
+
     def rand_int(self, min_val: int, max_val: int) -> int:
         """Generate a random integer within a range.
 
@@ -145,6 +151,73 @@ class RandomGenerator:
             raise ValueError('Count must be non-negative')
         return self._generator.rand_floats(min_val, max_val, count)
 
+    def rand_int_array(self, min_val: int, max_val: int, count: int) -> array[int]:
+        """Generate a typed array of random integral values.
+
+        Like `rand_ints`, but the values are written straight into a C ``int`` array,
+        without creating a Python object per value. The result can be passed to
+        `Container` or any consumer of the buffer protocol without conversion.
+
+        Parameters
+        ----------
+        min_val : int
+            Minimum value for each element (inclusive)
+        max_val : int
+            Maximum value for each element (inclusive)
+        count : int
+            Number of random values to generate
+
+        Returns
+        -------
+        array[int]
+            An array of random integral values with type code ``'i'``
+
+        Examples
+        --------
+        >>> rg = RandomGenerator()
+        >>> rg.rand_int_array(1, 10, 5)
+        array('i', [3, 8, 2, 6, 4])
+        """
+        if count < 0:
+            raise ValueError('Count must be non-negative')
+        values = array('i', [0]) * count
+        self._generator.fill_ints(values, min_val, max_val)
+        return values
+
+    def rand_float_array(
+        self, min_val: float, max_val: float, count: int
+    ) -> array[float]:
+        """Generate a typed array of random floating-point values.
+
+        Like `rand_floats`, but the values are written straight into a C ``double``
+        array, without creating a Python object per value.
+
+        Parameters
+        ----------
+        min_val : float
+            Minimum value for each element (inclusive)
+        max_val : float
+            Maximum value for each element (exclusive)
+        count : int
+            Number of random values to generate
+
+        Returns
+        -------
+        array[float]
+            An array of random floating-point values with type code ``'d'``
+
+        Examples
+        --------
+        >>> rg = RandomGenerator()
+        >>> rg.rand_float_array(0.0, 1.0, 3)
+        array('d', [0.234, 0.765, 0.123])
+        """
+        if count < 0:
+            raise ValueError('Count must be non-negative')
+        values = array('d', [0.0]) * count
+        self._generator.fill_floats(values, min_val, max_val)
+        return values
+
     def rand_bool(self, probability: float = 0.5) -> bool:
         """Generate a random boolean value with specified probability.
 
@@ -172,12 +245,54 @@ class RandomGenerator:
         """
         return self._generator.rand_bool(probability)
 
+    def rand_bools(self, probability: float, count: int) -> list[bool]:
+        """Generate a list of random boolean values with specified probability.
+
+        Efficiently generates a vector of independent Bernoulli trials in a single
+        call, instead of calling `rand_bool` once per value.
+
+        Parameters
+        ----------
+        probability : float
+            Probability of each value being True
+        count : int
+            Number of random values to generate
+
+        Returns
+        -------
+        list[bool]
+            A list of random boolean values
+
+        Raises
+        ------
+        ValueError
+            If count is negative or probability is not between 0.0 and 1.0
+
+        Examples
+        --------
+        >>> rg = RandomGenerator()
+        >>> rg.rand_bools(0.5, 5)
+        [True, False, False, True, False]
+        """
+        if count < 0:
+            raise ValueError('Count must be non-negative')
+        return self._generator.rand_bools(probability, count)
+
     def normal(self, mean: float = 0.0, stddev: float = 1.0) -> float:
         """Generate a random value from a normal (Gaussian) distribution.
 
         Generates a random value from a normal (Gaussian) distribution with the
         specified mean and standard deviation. This is useful for generating
         naturally distributed data, noise, or measurements with known statistics.
+        Standard normal values are drawn from C++ in batches and buffered, so most
+        calls do not cross into C++ at all.
+
+        Because of the buffering, a call that refills the buffer advances the shared
+        engine by a whole batch of 1024 draws. Values from the other methods are
+        therefore not interleaved with ``normal()`` in call order: after
+        ``seed(s)``, calling ``normal()`` once changes every later ``rand_int``
+        value. Sequences remain reproducible for the same seed and the same order
+        of calls.
 
         Parameters
         ----------
@@ -199,14 +314,85 @@ class RandomGenerator:
         >>> rg.normal(100.0, 15.0)
         105.0
         """
-        return self._generator.normal(mean, stddev)
+        if self._normal_index == len(self._normal_buffer):
+            self._normal_buffer = self._generator.normals(0.0, 1.0, _NORMAL_BUFFER_SIZE)
+            self._normal_index = 0
+        value = self._normal_buffer[self._normal_index]
+        self._normal_index += 1
+        return mean + stddev * value
+
+    def normals(self, mean: float, stddev: float, count: int) -> list[float]:
+        """Generate a list of random values from a normal (Gaussian) distribution.
+
+        Efficiently generates a vector of normally distributed random values. Each
+        value is independently generated with the specified mean and standard
+        deviation.
+
+        Parameters
+        ----------
+        mean : float
+            Mean (center) of the distribution
+        stddev : float
+            Standard deviation of the distribution
+        count : int
+            Number of random values to generate
+
+        Returns
+        -------
+        list[float]
+            A list of random values from the normal distribution
+
+        Examples
+        --------
+        >>> rg = RandomGenerator()
+        >>> rg.normals(100.0, 15.0, 3)
+        [105.0, 91.2, 110.7]
+        """
+        if count < 0:
+            raise ValueError('Count must be non-negative')
+        return self._generator.normals(mean, stddev, count)
+
+    def normal_array(self, mean: float, stddev: float, count: int) -> array[float]:
+        """Generate a typed array of normally distributed values.
+
+        Like `normals`, but the values are written straight into a C ``double``
+        array, without creating a Python object per value.
+
+        Parameters
+        ----------
+        mean : float
+            Mean of the normal distribution
+        stddev : float
+            Standard deviation of the normal distribution
+        count : int
+            Number of random values to generate
+
+        Returns
+        -------
+        array[float]
+            An array of normally distributed values with type code ``'d'``
+
+        Examples
+        --------
+        >>> rg = RandomGenerator()
+        >>> rg.normal_array(0.0, 1.0, 3)
+        array('d', [0.123, -1.456, 0.789])
+        """
+        if count < 0:
+            raise ValueError('Count must be non-negative')
+        values = array('d', [0.0]) * count
+        self._generator.fill_normals(values, mean, stddev)
+        return values
 
     def seed(self, seed: int) -> None:
         """Manually seed the random number generator.
 
         Sets a specific seed for the random number generator. This allows for
         reproducible random sequences, which is useful for testing, debugging,
-        or when deterministic behavior is required.
+        or when deterministic behavior is required. Any values buffered by
+        `normal` are discarded. The same calls in the same order then give the same
+        values, though `normal` draws in batches and so shifts the values returned
+        by later calls to other methods.
 
         Parameters
         ----------
@@ -225,6 +411,8 @@ class RandomGenerator:
         5
         """
         self._generator.seed(seed)
+        self._normal_buffer = []
+        self._normal_index = 0
 
     def seed_with_time(self) -> None:
         """Seed the generator using current time.
@@ -239,6 +427,8 @@ class RandomGenerator:
         >>> rg.seed_with_time()
         """
         self._generator.seed_with_time()
+        self._normal_buffer = []
+        self._normal_index = 0
 
 
 def shuffle(data: list[T] | Container[T]) -> None:
@@ -267,7 +457,7 @@ def shuffle(data: list[T] | Container[T]) -> None:
         case Container():
             _random.shuffle(data._container)
         case _:
-            random.shuffle(data)
+            data[:] = [data[i] for i in _random.permutation(len(data))]
 
 
 def sample(data: list[T] | Container[T], count: int) -> list[T]:
@@ -302,7 +492,7 @@ def sample(data: list[T] | Container[T], count: int) -> list[T]:
         case Container():
             return _random.sample(data._container, count)
         case _:
-            return random.sample(data, count)  # nosec B311
+            return [data[i] for i in _random.sample_indices(len(data), count)]
 
 
 __all__ = [
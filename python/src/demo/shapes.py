@@ -1,5 +1,7 @@
 """Python wrapper for the shapes module."""
 
+from array import array
+from collections.abc import Iterable
 from types import NotImplementedType
 
 from .cpp_features import shapes as _shapes
@@ -8,6 +10,8 @@ from .cpp_features import shapes as _shapes
 class Shape:
     """Base class for geometric shapes."""
 
+    __slots__ = ('_shape',)
+
     def __init__(self, shape: _shapes.Shape) -> None:
         """Initialize shape wrapper.
 
@@ -123,6 +127,8 @@ class Shape:
 class Circle(Shape):
     """Circle shape implementation with radius-based geometry."""
 
+    __slots__ = ()
+
     def __init__(self, radius: float) -> None:
         """Construct a circle with the specified radius.
 
@@ -152,6 +158,8 @@ class Circle(Shape):
 class Rectangle(Shape):
     """Rectangle shape implementation with width and height geometry."""
 
+    __slots__ = ()
+
     def __init__(self, width: float, height: float | None = None) -> None:
         """Construct a rectangle with the specified width and height.
 
@@ -195,7 +203,149 @@ class Rectangle(Shape):
         return self._shape.is_square()
 
 
+class CircleArray:
+    """A batch of circles stored as a contiguous array of radii.
+
+    Stores the geometry in structure-of-arrays form, so that batch computations run
+    in C++ over the whole array instead of one C++ call per shape. The radii are
+    private, so they stay valid after construction.
+    """
+
+    __slots__ = ('_radii',)
+
+    def __init__(self, radii: Iterable[float]) -> None:
+        """Construct a batch of circles with the specified radii.
+
+        Parameters
+        ----------
+        radii : Iterable[float]
+            Radii of the circles
+
+        Raises
+        ------
+        ValidationException
+            If any radius is not positive
+
+        Examples
+        --------
+        >>> circles = CircleArray([1.0, 2.0, 3.0])
+        """
+        self._radii = array('d', radii)
+        _shapes.validate_circles(self._radii)
+
+    def __len__(self) -> int:
+        """Get the number of circles in the batch."""
+        return len(self._radii)
+
+    def areas(self) -> list[float]:
+        """Calculate the areas of all circles.
+
+        Returns
+        -------
+        list[float]
+            Areas of the circles, in order
+
+        Examples
+        --------
+        >>> CircleArray([1.0, 2.0]).areas()
+        [3.141592653589793, 12.566370614359172]
+        """
+        return _shapes.circle_areas(self._radii)
+
+    def perimeters(self) -> list[float]:
+        """Calculate the perimeters of all circles.
+
+        Returns
+        -------
+        list[float]
+            Perimeters of the circles, in order
+
+        Examples
+        --------
+        >>> CircleArray([1.0, 2.0]).perimeters()
+        [6.283185307179586, 12.566370614359172]
+        """
+        return _shapes.circle_perimeters(self._radii)
+
+
+class RectangleArray:
+    """A batch of rectangles stored as contiguous arrays of widths and heights.
+
+    Stores the geometry in structure-of-arrays form, so that batch computations run
+    in C++ over the whole arrays instead of one C++ call per shape. The dimensions
+    are private, so they stay valid after construction.
+    """
+
+    __slots__ = ('_widths', '_heights')
+
+    def __init__(
+        self, widths: Iterable[float], heights: Iterable[float] | None = None
+    ) -> None:
+        """Construct a batch of rectangles with the specified widths and heights.
+
+        Parameters
+        ----------
+        widths : Iterable[float]
+            Widths of the rectangles
+        heights : Iterable[float], optional
+            Heights of the rectangles. If not provided, defaults to the widths.
+
+        Raises
+        ------
+        ValueError
+            If widths and heights have different lengths
+        ValidationException
+            If any width or height is not positive
+
+        Examples
+        --------
+        >>> rectangles = RectangleArray([4.0, 2.0], [3.0, 6.0])
+        >>> squares = RectangleArray([5.0, 1.0])  # 5.0 x 5.0 and 1.0 x 1.0 squares
+        """
+        self._widths = array('d', widths)
+        self._heights = array('d', heights if heights is not None else self._widths)
+        if len(self._widths) != len(self._heights):
+            raise ValueError('Widths and heights must have the same length')
+        _shapes.validate_rectangles(self._widths, self._heights)
+
+    def __len__(self) -> int:
+        """Get the number of rectangles in the batch."""
+        return len(self._widths)
+
+    def areas(self) -> list[float]:
+        """Calculate the areas of all rectangles.
+
+        Returns
+        -------
+        list[float]
+            Areas of the rectangles, in order
+
+        Examples
+        --------
+        >>> RectangleArray([4.0, 2.0], [3.0, 6.0]).areas()
+        [12.0, 12.0]
+        """
+        return _shapes.rectangle_areas(self._widths, self._heights)
+
+    def perimeters(self) -> list[float]:
+        """Calculate the perimeters of all rectangles.
+
+        Returns
+        -------
+        list[float]
+            Perimeters of the rectangles, in order
+
+        Examples
+        --------
+        >>> RectangleArray([4.0, 2.0], [3.0, 6.0]).perimeters()
+        [14.0, 16.0]
+        """
+        return _shapes.rectangle_perimeters(self._widths, self._heights)
+
+
 __all__ = [
     'Circle',
     'Rectangle',
+    'CircleArray',
+    'RectangleArray',
 ]
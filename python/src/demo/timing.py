@@ -1,23 +1,54 @@
 """Python wrapper for the timing module."""
 
-from collections.abc import Callable, Generator
-from contextlib import contextmanager
+from collections.abc import Callable
+from functools import lru_cache
 from types import TracebackType
 from typing import Any
 
 from .cpp_features import timing as _timing
 
 
+_NANOSECONDS_PER_MICROSECOND = 1_000
+_NANOSECONDS_PER_MILLISECOND = 1_000_000
+_NANOSECONDS_PER_SECOND = 1_000_000_000
+
+# Functions faster than this are timed in batches when the batch size is automatic
+_AUTO_BATCH_NS = 1_000
+_AUTO_BATCH_SIZE = 1000
+
+
 class Timer:
     """High-resolution timer class for measuring elapsed time."""
 
+    __slots__ = (
+        '_timer',
+        '_start',
+        '_stop',
+        '_reset',
+        '_get_elapsed_ns',
+        '_get_elapsed_us',
+        '_get_elapsed_ms',
+        '_get_elapsed_s',
+        '_stopped',
+    )
+
     def __init__(self) -> None:
         """Construct a timer and start timing immediately.
 
         Creates a new timer instance and captures the current time as the start point.
         The timer begins measuring elapsed time immediately upon construction.
         """
-        self._timer = _timing.Timer()
+        self._timer = timer = _timing.Timer()
+
+        # Cache the bound C++ methods to skip the attribute lookups on every call
+        self._start = timer.start
+        self._stop = timer.stop
+        self._reset = timer.reset
+        self._get_elapsed_ns = timer.get_elapsed_ns
+        self._get_elapsed_us = timer.get_elapsed_us
+        self._get_elapsed_ms = timer.get_elapsed_ms
+        self._get_elapsed_s = timer.get_elapsed_s
+        self._stopped = False
 
     def start(self) -> None:
         """Start or restart the timer.
@@ -25,7 +56,8 @@ class Timer:
         Captures the current time as the start point for timing measurements.
         If the timer was already running, this restarts the measurement.
         """
-        self._timer.start()
+        self._start()
+        self._stopped = False
 
     def stop(self) -> None:
         """Stop the timer.
@@ -34,7 +66,8 @@ class Timer:
         After calling stop(), get_elapsed() methods will return the fixed
         duration between start() and stop() calls.
         """
-        self._timer.stop()
+        self._stop()
+        self._stopped = True
 
     def reset(self) -> None:
         """Reset the timer to start a new measurement.
@@ -43,7 +76,8 @@ class Timer:
         clearing any previously recorded end time. This allows reusing the same
         timer instance for multiple measurements.
         """
-        self._timer.reset()
+        self._reset()
+        self._stopped = False
 
     @property
     def elapsed_ns(self) -> int:
@@ -54,7 +88,7 @@ class Timer:
         int
             The elapsed time in nanoseconds
         """
-        return self._timer.get_elapsed_ns()
+        return self._get_elapsed_ns()
 
     @property
     def elapsed_us(self) -> int:
@@ -65,7 +99,7 @@ class Timer:
         int
             The elapsed time in microseconds
         """
-        return self._timer.get_elapsed_us()
+        return self._get_elapsed_us()
 
     @property
     def elapsed_ms(self) -> int:
@@ -76,7 +110,7 @@ class Timer:
         int
             The elapsed time in milliseconds
         """
-        return self._timer.get_elapsed_ms()
+        return self._get_elapsed_ms()
 
     @property
     def elapsed_s(self) -> int:
@@ -87,7 +121,7 @@ class Timer:
         int
             The elapsed time in seconds
         """
-        return self._timer.get_elapsed_s()
+        return self._get_elapsed_s()
 
     @property
     def elapsed_str(self) -> str:
@@ -98,7 +132,7 @@ class Timer:
         str
             A formatted string representing the elapsed time with units
         """
-        return self._timer.get_elapsed_str()
+        return to_human_readable(self._get_elapsed_ns())
 
     def __enter__(self) -> 'Timer':
         """Context manager entry.
@@ -122,7 +156,8 @@ class Timer:
     ) -> None:
         """Context manager exit.
 
-        Stops the timer. Allows any exceptions to propagate normally.
+        Stops the timer, unless it was already stopped inside the block. Allows any
+        exceptions to propagate normally.
 
         Parameters
         ----------
@@ -133,11 +168,11 @@ class Timer:
         exc_traceback : TracebackType, optional
             Exception traceback (if any)
         """
-        self.stop()
+        if not self._stopped:
+            self.stop()
 
 
-@contextmanager
-def measure_time(name: str | None = None) -> Generator[Timer]:
+class measure_time:
     """Context manager for measuring the execution time of a block of code.
 
     Parameters
@@ -145,11 +180,6 @@ def measure_time(name: str | None = None) -> Generator[Timer]:
     name : str, optional
         Descriptive name for the timed operation
 
-    Yields
-    ------
-    Timer
-        Timer instance for the measurement
-
     Examples
     --------
     >>> from time import sleep
@@ -159,21 +189,64 @@ def measure_time(name: str | None = None) -> Generator[Timer]:
     ...
     Scoped operation: 3s
     """
-    timer = Timer()
-    if not name:
-        name = 'Elapsed'
-    try:
-        yield timer
-    finally:
-        timer.stop()
-        print(f'{name}: {timer.elapsed_str}')
 
+    __slots__ = ('name', 'timer')
+
+    def __init__(self, name: str | None = None) -> None:
+        """Initialize the scoped measurement.
+
+        Parameters
+        ----------
+        name : str, optional
+            Descriptive name for the timed operation
+        """
+        self.name = name or 'Elapsed'
+
+    def __enter__(self) -> Timer:
+        """Context manager entry.
+
+        Starts a new timer for the measurement.
 
+        Returns
+        -------
+        Timer
+            Timer instance for the measurement
+        """
+        self.timer = Timer()
+        return self.timer
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        exc_traceback: TracebackType | None,
+    ) -> None:
+        """Context manager exit.
+
+        Stops the timer and prints the elapsed time. Allows any exceptions to propagate
+        normally.
+
+        Parameters
+        ----------
+        exc_type : type[BaseException], optional
+            Exception type (if any)
+        exc_value : BaseException, optional
+            Exception value (if any).
+        exc_traceback : TracebackType, optional
+            Exception traceback (if any)
+        """
+        self.timer.__exit__(exc_type, exc_value, exc_traceback)
+        print(f'{self.name}: {self.timer.elapsed_str}')
+
+
+@lru_cache(maxsize=256)
 def to_human_readable(ns: int) -> str:
     """Convert a duration in nanoseconds to a human-readable string.
 
     Automatically selects the most appropriate unit (ns, μs, ms, s) based on the
-    magnitude of the duration for optimal readability.
+    magnitude of the duration for optimal readability. Formatted in Python with the
+    same rules as the C++ implementation, avoiding a round trip for a string.
+    Results are memoized, as the same durations tend to be formatted repeatedly.
 
     Parameters
     ----------
@@ -190,28 +263,25 @@ def to_human_readable(ns: int) -> str:
     >>> to_human_readable(123_456_789)
     '123.46ms'
     """
-    return _timing.to_human_readable(ns)
+    if ns < _NANOSECONDS_PER_MICROSECOND:
+        return f'{ns}ns'
+    if ns < _NANOSECONDS_PER_MILLISECOND:
+        return f'{ns / _NANOSECONDS_PER_MICROSECOND:.2f}μs'
+    if ns < _NANOSECONDS_PER_SECOND:
+        return f'{ns / _NANOSECONDS_PER_MILLISECOND:.2f}ms'
+    return f'{ns / _NANOSECONDS_PER_SECOND:.2f}s'
 
 
-def time_function(func: Callable[[], Any]) -> int:
-    """Utility function to time a single function execution.
-
-    Parameters
-    ----------
-    func : Callable[[], Any]
-        Function to time
-
-    Returns
-    -------
-    int
-        Elapsed time in nanoseconds
-    """
-    return _timing.time_function(func)
+# Forwarded without a Python frame so timing loops only pay for the C++ call.
+# The binding carries the docstring, as builtin functions cannot be re-documented.
+time_function: Callable[[Callable[[], Any]], int] = _timing.time_function
 
 
 class BenchmarkResult:
     """Structure containing benchmark results and statistics."""
 
+    __slots__ = ('_result',)
+
     def __init__(self, result: _timing.BenchmarkResult) -> None:
         """Initialize BenchmarkResult wrapper.
 
@@ -262,10 +332,21 @@ class BenchmarkResult:
 
 
 def benchmark(
-    name: str, func: Callable[[], Any], *, iterations: int = 1000
+    name: str,
+    func: Callable[[], Any],
+    *,
+    iterations: int = 1000,
+    batch: int | None = 1,
 ) -> BenchmarkResult:
     """Utility function to benchmark a function with a given number of iterations.
 
+    Fast functions can be executed in batches, timing several calls per clock reading
+    so that the cost of reading the clock does not dominate the measurement. The
+    reported average is then per call, while the minimum and maximum are the lowest
+    and highest per-call averages of a batch. Exactly ``iterations`` calls are made:
+    if ``iterations`` is not a multiple of the batch size, the remaining calls are
+    timed as one shorter batch.
+
     Parameters
     ----------
     name : str
@@ -274,12 +355,20 @@ def benchmark(
         Function to benchmark
     iterations : int, default=1000
         Number of times to execute the function
+    batch : int | None, default=1
+        Number of calls timed together per measurement, at most ``iterations``. If
+        None, a batch size is chosen by timing one extra probe call of the function.
 
     Returns
     -------
     BenchmarkResult
         Structure containing timing statistics
 
+    Raises
+    ------
+    ValueError
+        If the batch size is not positive
+
     Examples
     --------
     >>> from random import randint
@@ -295,8 +384,35 @@ def benchmark(
     - Average: 12.3μs
     - Min: 10.1μs
     - Max: 15.7μs
+    >>> result = benchmark('Addition', lambda: 1 + 1, iterations=100_000, batch=None)
     """
-    result = _timing.BenchmarkRunner.benchmark(name, func, iterations)
+    if batch is None:
+        batch = _AUTO_BATCH_SIZE if time_function(func) < _AUTO_BATCH_NS else 1
+    if batch < 1:
+        raise ValueError('Batch size must be positive')
+    batch = max(min(batch, iterations), 1)
+    if batch == 1:
+        result = _timing.BenchmarkRunner.benchmark(name, func, iterations)
+        return BenchmarkResult(result)
+
+    def run_calls(calls: int) -> None:
+        for _ in range(calls):
+            func()
+
+    rounds, remainder = divmod(iterations, batch)
+    result = _timing.BenchmarkRunner.benchmark(name, lambda: run_calls(batch), rounds)
+    min_ns = result.min_ns // batch
+    max_ns = result.max_ns // batch
+    if remainder:
+        remainder_ns = time_function(lambda: run_calls(remainder))
+        result.total_ns += remainder_ns
+        min_ns = min(min_ns, remainder_ns // remainder)
+        max_ns = max(max_ns, remainder_ns // remainder)
+
+    result.iterations = iterations
+    result.avg_ns = result.total_ns // iterations
+    result.min_ns = min_ns
+    result.max_ns = max_ns
     return BenchmarkResult(result)
 
 
@@ -1,10 +1,20 @@
 """Tests for the containers module."""
 
+from array import array
+from decimal import Decimal
+from fractions import Fraction
+
 import pytest
 
 from demo.containers import Container
 
 
+@pytest.fixture(scope='module')
+def int_container() -> Container[int]:
+    """Fixture for a shared integer container, only for tests that do not mutate it."""
+    return Container(int, [1, 2, 3, 4, 5])
+
+
 class TestContainerBasic:
     """Test Container creation and basic operations."""
 
@@ -16,27 +26,35 @@ class TestContainerBasic:
         assert bool(container) is False
         assert list(container) == []
 
-    def test_int_container_creation(self) -> None:
+    def test_int_container_creation(self, int_container: Container[int]) -> None:
         """Test creating integer container."""
-        container = Container(int, [1, 2, 3, 4, 5])
+        container = int_container
 
         assert len(container) == 5
         assert bool(container) is True
-        assert list(container) == [1, 2, 3, 4, 5]
+        assert container == [1, 2, 3, 4, 5]
 
     def test_float_container_creation(self) -> None:
         """Test creating float container."""
         container = Container(float, [1.5, 2.5, 3.5])
 
         assert len(container) == 3
-        assert list(container) == [1.5, 2.5, 3.5]
+        assert container == [1.5, 2.5, 3.5]
 
     def test_string_container_creation(self) -> None:
         """Test creating string container."""
         container = Container(str, ['hello', 'world'])
 
         assert len(container) == 2
-        assert list(container) == ['hello', 'world']
+        assert container == ['hello', 'world']
+
+    def test_buffer_creation(self) -> None:
+        """Test creating numeric containers from buffers."""
+        assert Container(int, array('i', [1, 2, 3])) == [1, 2, 3]
+        assert Container(float, array('d', [1.5, 2.5])) == [1.5, 2.5]
+        assert Container(float, array('i', [1, 2])) == [1.0, 2.0]
+        assert Container(int, memoryview(array('i', [1, 2, 3, 4]))[::2]) == [1, 3]
+        assert Container(int, array('i')) == []
 
     def test_unsupported_type_creation(self) -> None:
         """Test creating container with unsupported type."""
@@ -53,8 +71,9 @@ class TestContainerOperations:
 
         container.add(4)
         container.add(5)
+        assert 4 in container
         assert len(container) == 5
-        assert list(container) == [1, 2, 3, 4, 5]
+        assert container == [1, 2, 3, 4, 5]
 
     def test_remove(self) -> None:
         """Test removing items from container."""
@@ -62,29 +81,50 @@ class TestContainerOperations:
 
         removed_count = container.remove(2)
         assert removed_count == 2
-        assert 2 not in list(container)
+        assert 2 not in container
         assert len(container) == 3
-        assert list(container) == [1, 3, 4]
+        assert container == [1, 3, 4]
 
-    def test_access(self) -> None:
+    def test_access(self, int_container: Container[int]) -> None:
         """Test accessing items in container."""
-        container = Container(int, [1, 2, 3, 4, 5])
+        container = int_container
 
         assert container[0] == 1
         assert container[4] == 5
         assert container[-2] == 4
+        assert container[-5] == 1
         with pytest.raises(IndexError, match='Index out of bounds'):
             container[5]
-
-    def test_iteration(self) -> None:
+        with pytest.raises(IndexError, match='Index out of bounds'):
+            container[-6]
+
+    def test_contains(self, int_container: Container[int]) -> None:
+        """Test membership checks."""
+        assert 3 in int_container
+        assert 6 not in int_container
+        assert 'hello' not in int_container
+        assert 2.5 not in int_container
+        assert 2 in Container(float, [2.0])
+        assert 'world' in Container(str, ['hello', 'world'])
+
+    def test_contains_does_not_truncate(self) -> None:
+        """Test that non-integral numbers are not found in an integer container."""
+        container = Container(int, [2])
+
+        assert Decimal('2.5') not in container
+        assert Fraction(5, 2) not in container
+        assert Decimal('2.5') not in Container(float, [2.5])
+
+    def test_iteration(self, int_container: Container[int]) -> None:
         """Test iterating over container."""
-        container = Container(int, [1, 2, 3, 4])
+        container = int_container
 
         iterator = iter(container)
         assert next(iterator) == 1
         assert next(iterator) == 2
         assert next(iterator) == 3
         assert next(iterator) == 4
+        assert next(iterator) == 5
         with pytest.raises(StopIteration):
             next(iterator)
 
@@ -103,9 +143,9 @@ class TestContainerOperations:
         assert len(large_values) == 2
         assert large_values == [6, 7]
 
-    def test_transform(self) -> None:
+    def test_transform(self, int_container: Container[int]) -> None:
         """Test transforming container elements."""
-        container = Container(int, [1, 2, 3, 4, 5])
+        container = int_container
 
         squares = container.transform(lambda x: x * x)
         assert len(squares) == 5
@@ -115,13 +155,79 @@ class TestContainerOperations:
         assert len(strings) == 5
         assert strings == ['1', '2', '3', '4', '5']
 
+        with pytest.raises(ZeroDivisionError):
+            Container(int, [1, 0]).transform(lambda x: 1 // x)
+
+    def test_to_list(self, int_container: Container[int]) -> None:
+        """Test copying container elements into a list."""
+        assert int_container.to_list() == [1, 2, 3, 4, 5]
+        assert Container(str, ['hello', 'world']).to_list() == ['hello', 'world']
+        assert Container(float).to_list() == []
+
+    def test_equality(self, int_container: Container[int]) -> None:
+        """Test comparing containers with containers and sequences."""
+        assert int_container == Container(int, [1, 2, 3, 4, 5])
+        assert int_container == (1, 2, 3, 4, 5)
+        assert int_container != [1, 2, 3]
+        assert int_container != Container(int, [5, 4, 3, 2, 1])
+        assert int_container != '12345'
+        assert Container(str, ['a', 'b']) == ['a', 'b']
+
+    def test_unhashable(self, int_container: Container[int]) -> None:
+        """Test that containers cannot be hashed, as they compare by value."""
+        with pytest.raises(TypeError, match='unhashable'):
+            hash(int_container)
+
+    def test_buffer(self, int_container: Container[int]) -> None:
+        """Test viewing numeric container elements through the buffer protocol."""
+        view = memoryview(int_container)
+        assert view.readonly
+        assert view.tolist() == [1, 2, 3, 4, 5]
+
+        floats = memoryview(Container(float, [1.5, 2.5]))
+        assert floats.tolist() == [1.5, 2.5]
+
+        with pytest.raises(TypeError):
+            memoryview(Container(str, ['hello']))
+
+    def test_resize_while_exported(self) -> None:
+        """Test that a container cannot be resized while a buffer view is alive."""
+        container = Container(int, [1, 2, 3])
+
+        with memoryview(container) as view:
+            with pytest.raises(BufferError):
+                container.add(4)
+            with pytest.raises(BufferError):
+                container.remove(1)
+            assert view.tolist() == [1, 2, 3]
+
+        container.add(4)
+        assert container.remove(1) == 1
+        assert container == [2, 3, 4]
+
+    def test_exports_are_counted_per_container(self) -> None:
+        """Test that every view must be released, and only its container is locked."""
+        container = Container(int, [1, 2, 3])
+        other = Container(int, [1, 2, 3])
+
+        with memoryview(container), memoryview(container):
+            other.add(4)
+
+            with memoryview(container):
+                pass
+            with pytest.raises(BufferError):
+                container.add(4)
+
+        container.add(4)
+        assert container == other
+
 
 class TestContainerRepresentation:
     """Test container representation."""
 
-    def test_str(self) -> None:
+    def test_str(self, int_container: Container[int]) -> None:
         """Test string representation."""
-        container = Container(int, [1, 2, 3, 4, 5])
+        container = int_container
 
         assert str(container) == '[1, 2, 3, 4, 5]'
 
@@ -1,5 +1,7 @@
 """Tests for the exceptions module."""
 
+from collections.abc import Callable
+
 import pytest
 
 from demo.exceptions import (
@@ -34,6 +36,12 @@ class TestErrorSeverity:
         """All severities convert to the expected string."""
         assert str(severity) == severity.name
 
+    def test_ordering(self) -> None:
+        """Severities compare by their integral level."""
+        assert ErrorSeverity.TRACE < ErrorSeverity.DEBUG < ErrorSeverity.INFO
+        assert ErrorSeverity.WARNING < ErrorSeverity.ERROR < ErrorSeverity.FATAL
+        assert int(ErrorSeverity.TRACE) == 0
+
 
 class TestValidationException:
     """Test ValidationException functionality."""
@@ -62,16 +70,6 @@ class TestValidationException:
         with pytest.raises(BaseException, match=message):
             raise ValidationException(message)
 
-    def test_throw_from_cpp(self) -> None:
-        """Test throwing ValidationException from C++."""
-        message = 'Test validation exception'
-        field_name = 'test_field'
-
-        with pytest.raises(ValidationException, match=message) as exc_info:
-            _test_throw_validation_exception()
-
-        assert exc_info.value.field_name == field_name
-
 
 class TestResourceException:
     """Test ResourceException functionality."""
@@ -100,16 +98,6 @@ class TestResourceException:
         with pytest.raises(BaseException, match=message):
             raise ResourceException(message)
 
-    def test_throw_from_cpp(self) -> None:
-        """Test throwing ResourceException from C++."""
-        message = 'Test resource exception'
-        resource_name = 'test_resource'
-
-        with pytest.raises(ResourceException, match=message) as exc_info:
-            _test_throw_resource_exception()
-
-        assert exc_info.value.resource_name == resource_name
-
 
 class TestCalculationException:
     """Test CalculationException functionality."""
@@ -138,36 +126,66 @@ class TestCalculationException:
         with pytest.raises(BaseException, match=message):
             raise CalculationException(message)
 
-    def test_throw_from_cpp(self) -> None:
-        """Test throwing CalculationException from C++."""
-        message = 'Test calculation exception'
-        input_value = 1.0
 
-        with pytest.raises(CalculationException, match=message) as exc_info:
-            _test_throw_calculation_exception()
+class TestCppThrows:
+    """Test exceptions thrown from C++."""
 
-        assert exc_info.value.input_value == input_value
-
-
-class TestBaseException:
-    """Test BaseException functionality."""
-
-    def test_throw_from_cpp(self) -> None:
-        """Test throwing BaseException from C++."""
-        message = 'Test base exception'
-
-        with pytest.raises(BaseException, match=message) as exc_info:
-            _test_throw_base_exception()
-
-        assert exc_info.value.severity == ErrorSeverity.WARNING
-
-
-class TestUnknownException:
-    """Test UnknownException functionality."""
-
-    def test_throw_from_cpp(self) -> None:
-        """Test throwing UnknownException from C++."""
-        message = 'Test unknown exception'
-
-        with pytest.raises(RuntimeError, match=message):
-            _test_throw_unknown_exception()
+    @pytest.mark.parametrize(
+        'throw, exc_type, message, attr, value',
+        [
+            pytest.param(
+                _test_throw_validation_exception,
+                ValidationException,
+                'Test validation exception',
+                'field_name',
+                'test_field',
+                id='validation',
+            ),
+            pytest.param(
+                _test_throw_resource_exception,
+                ResourceException,
+                'Test resource exception',
+                'resource_name',
+                'test_resource',
+                id='resource',
+            ),
+            pytest.param(
+                _test_throw_calculation_exception,
+                CalculationException,
+                'Test calculation exception',
+                'input_value',
+                1.0,
+                id='calculation',
+            ),
+            pytest.param(
+                _test_throw_base_exception,
+                BaseException,
+                'Test base exception',
+                'severity',
+                ErrorSeverity.WARNING,
+                id='base',
+            ),
+            pytest.param(
+                _test_throw_unknown_exception,
+                RuntimeError,
+                'Test unknown exception',
+                None,
+                None,
+                id='unknown',
+            ),
+        ],
+    )
+    def test_throw_from_cpp(
+        self,
+        throw: Callable[[], None],
+        exc_type: type[Exception],
+        message: str,
+        attr: str | None,
+        value: object,
+    ) -> None:
+        """Test throwing exceptions from C++."""
+        with pytest.raises(exc_type, match=message) as exc_info:
+            throw()
+
+        if attr is not None:
+            assert getattr(exc_info.value, attr) == value
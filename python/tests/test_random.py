@@ -1,5 +1,12 @@
 """Tests for the random module."""
 
+from array import array
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from statistics import fmean
+from time import sleep
+from unittest.mock import patch
+
 import pytest
 
 from demo.containers import Container
@@ -29,13 +36,44 @@ class TestRandomGeneratorBasic:
 
         assert value1 == value2
 
+    def test_methods_can_be_overridden(self) -> None:
+        """Test that scalar methods resolve through the class."""
 
-@pytest.fixture
-def rg() -> RandomGenerator:
-    """Fixture for random generator with fixed seed."""
+        class FixedGenerator(RandomGenerator):
+            def rand_int(self, min_val: int, max_val: int) -> int:
+                return min_val
+
+        assert FixedGenerator().rand_int(3, 10) == 3
+
+        with patch.object(RandomGenerator, 'rand_float', return_value=0.25):
+            assert RandomGenerator().rand_float(0.0, 1.0) == 0.25
+
+
+@pytest.fixture(scope='session')
+def shared_rg() -> RandomGenerator:
+    """Fixture for a random generator created once per session."""
     return RandomGenerator(seed=42)
 
 
+@pytest.fixture
+def rg(shared_rg: RandomGenerator) -> RandomGenerator:
+    """Fixture for random generator with fixed seed, reseeded for every test."""
+    shared_rg.seed(42)
+    return shared_rg
+
+
+@pytest.fixture(scope='module')
+def int_population() -> Container[int]:
+    """Fixture for the integers 1 to 20, shuffled only through a copy."""
+    return Container(int, range(1, 21))
+
+
+@pytest.fixture(scope='module')
+def float_population() -> Container[float]:
+    """Fixture for the floats 1.0 to 10.0, a read-only population to sample from."""
+    return Container(float, [float(x) for x in range(1, 11)])
+
+
 class TestRandomGeneratorInt:
     """Test RandomGenerator integral number generation."""
 
@@ -47,6 +85,7 @@ class TestRandomGeneratorInt:
             (-100, -10),
             (1000000, 2000000),
         ],
+        ids=['positive', 'single_value', 'negative', 'large'],
     )
     def test_generate_int_values(
         self, rg: RandomGenerator, min_val: int, max_val: int
@@ -69,6 +108,7 @@ class TestRandomGeneratorFloat:
             (-10.0, -5.0),
             (0.0, 0.001),
         ],
+        ids=['unit', 'negative', 'narrow'],
     )
     def test_generate_float_values(
         self, rg: RandomGenerator, min_val: float, max_val: float
@@ -89,6 +129,7 @@ class TestRandomGeneratorList:
             (1, 49, 10),
             (1, 10, 0),
         ],
+        ids=['some', 'empty'],
     )
     def test_generate_int_list(
         self, rg: RandomGenerator, min_val: int, max_val: int, count: int
@@ -108,6 +149,7 @@ class TestRandomGeneratorList:
             (0.0, 1.0, 10),
             (-10.0, -9.0, 0),
         ],
+        ids=['some', 'empty'],
     )
     def test_generate_float_list(
         self, rg: RandomGenerator, min_val: float, max_val: float, count: int
@@ -126,6 +168,7 @@ class TestRandomGeneratorList:
         [
             (1, 100, 1000),
         ],
+        ids=['thousand'],
     )
     def test_generate_large_list(
         self, rg: RandomGenerator, min_val: int, max_val: int, count: int
@@ -141,6 +184,21 @@ class TestRandomGeneratorList:
         has_different = any(value != first_value for value in values)
         assert has_different  # Should have some variety
 
+    def test_generate_typed_arrays(self, rg: RandomGenerator) -> None:
+        """Test generating typed arrays."""
+        ints = rg.rand_int_array(1, 6, 100)
+        assert isinstance(ints, array)
+        assert ints.typecode == 'i'
+        assert len(ints) == 100
+        assert all(1 <= value <= 6 for value in ints)
+
+        floats = rg.rand_float_array(0.0, 1.0, 100)
+        assert floats.typecode == 'd'
+        assert len(floats) == 100
+        assert all(0.0 <= value < 1.0 for value in floats)
+
+        assert len(rg.rand_int_array(1, 6, 0)) == 0
+
     def test_generate_negative_count(self, rg: RandomGenerator) -> None:
         """Test generating list with negative count."""
         with pytest.raises(ValueError, match='Count must be non-negative'):
@@ -149,6 +207,12 @@ class TestRandomGeneratorList:
         with pytest.raises(ValueError, match='Count must be non-negative'):
             rg.rand_floats(0.0, 1.0, -1)
 
+        with pytest.raises(ValueError, match='Count must be non-negative'):
+            rg.rand_int_array(1, 10, -1)
+
+        with pytest.raises(ValueError, match='Count must be non-negative'):
+            rg.rand_float_array(0.0, 1.0, -1)
+
 
 class TestRandomGeneratorBool:
     """Test RandomGenerator boolean generation."""
@@ -160,6 +224,7 @@ class TestRandomGeneratorBool:
             0.9,
             0.1,
         ],
+        ids=['fair', 'biased_high', 'biased_low'],
     )
     def test_coin_flips(self, rg: RandomGenerator, probability: float) -> None:
         """Test fair coin flip (50% probability)."""
@@ -179,12 +244,12 @@ class TestRandomGeneratorBool:
         iterations = 1000
 
         # Test 0% probability
-        for _ in range(iterations):
-            assert rg.rand_bool(0.0) is False
+        assert rg.rand_bool(0.0) is False
+        assert not any(rg.rand_bools(0.0, iterations))
 
         # Test 100% probability
-        for _ in range(iterations):
-            assert rg.rand_bool(1.0) is True
+        assert rg.rand_bool(1.0) is True
+        assert all(rg.rand_bools(1.0, iterations))
 
     def test_invalid_probability(self, rg: RandomGenerator) -> None:
         """Test invalid probability values."""
@@ -194,6 +259,34 @@ class TestRandomGeneratorBool:
         with pytest.raises(ValueError, match='Probability must be between 0.0 and 1.0'):
             rg.rand_bool(10.0)
 
+        with pytest.raises(ValueError, match='Probability must be between 0.0 and 1.0'):
+            rg.rand_bools(1.5, 10)
+
+    @pytest.mark.parametrize(
+        'probability',
+        [
+            0.5,
+            0.9,
+            0.1,
+        ],
+        ids=['fair', 'biased_high', 'biased_low'],
+    )
+    def test_generate_bool_list(self, rg: RandomGenerator, probability: float) -> None:
+        """Test generating list of boolean values."""
+        iterations = 1000
+
+        flips = rg.rand_bools(probability, iterations)
+
+        assert isinstance(flips, list)
+        assert len(flips) == iterations
+
+        true_count = sum(flips)
+        assert true_count > int(iterations * (probability - 0.2))
+        assert true_count < int(iterations * (probability + 0.2))
+
+        with pytest.raises(ValueError, match='Count must be non-negative'):
+            rg.rand_bools(probability, -1)
+
 
 class TestRandomGeneratorNormal:
     """Test RandomGenerator normal distribution generation."""
@@ -202,14 +295,13 @@ class TestRandomGeneratorNormal:
         """Test standard normal distribution."""
         mean = 0.0
         stddev = 1.0
-        iterations = 1000
+        # Enough draws to span several refills of the buffer behind normal()
+        iterations = 2500
 
-        values = []
-        for _ in range(iterations):
-            values.append(rg.normal(mean, stddev))
+        values = [rg.normal(mean, stddev) for _ in range(iterations)]
 
         # Calculate sample mean and verify it's close to expected
-        sample_mean = sum(values) / len(values)
+        sample_mean = fmean(values)
 
         # Sample mean should be close to theoretical mean (within 0.2)
         assert abs(sample_mean - mean) < 0.2
@@ -225,6 +317,7 @@ class TestRandomGeneratorNormal:
             (100.0, 15.0),
             (5.0, 0.1),
         ],
+        ids=['wide', 'narrow'],
     )
     def test_custom_normal_distribution(
         self, rg: RandomGenerator, mean: float, stddev: float
@@ -236,6 +329,43 @@ class TestRandomGeneratorNormal:
         assert value > mean - (5.0 * stddev)
         assert value < mean + (5.0 * stddev)
 
+    def test_generate_normal_list(self, rg: RandomGenerator) -> None:
+        """Test generating list of normally distributed values."""
+        values = rg.normals(100.0, 15.0, 1000)
+
+        assert isinstance(values, list)
+        assert len(values) == 1000
+        assert abs(fmean(values) - 100.0) < 3.0
+
+        with pytest.raises(ValueError, match='Count must be non-negative'):
+            rg.normals(0.0, 1.0, -1)
+
+    def test_generate_normal_array(self, rg: RandomGenerator) -> None:
+        """Test generating typed array of normally distributed values."""
+        rg.seed(2024)
+        values = rg.normal_array(100.0, 15.0, 1000)
+
+        assert isinstance(values, array)
+        assert values.typecode == 'd'
+        assert len(values) == 1000
+        assert abs(fmean(values) - 100.0) < 3.0
+
+        rg.seed(2024)
+        assert values.tolist() == rg.normals(100.0, 15.0, 1000)
+
+        with pytest.raises(ValueError, match='Count must be non-negative'):
+            rg.normal_array(0.0, 1.0, -1)
+
+    def test_reseeding_resets_normal_sequence(self, rg: RandomGenerator) -> None:
+        """Test that re-seeding discards buffered normal values."""
+        rg.seed(2024)
+        first_sequence = [rg.normal() for _ in range(10)]
+
+        rg.seed(2024)
+        second_sequence = [rg.normal() for _ in range(10)]
+
+        assert first_sequence == second_sequence
+
 
 class TestRandomGeneratorSeeding:
     """Test RandomGenerator seeding functionality."""
@@ -269,19 +399,34 @@ class TestRandomGeneratorSeeding:
 
     def test_seed_with_time_non_deterministic(self) -> None:
         """Test that seed_with_time provides non-deterministic behavior."""
-        import time
-
         rg = RandomGenerator()
         rg.seed_with_time()
         first_sequence = rg.rand_ints(1, 100, 100)
 
-        time.sleep(0.01)
+        sleep(0.01)
         rg.seed_with_time()
         second_sequence = rg.rand_ints(1, 100, 100)
 
         assert first_sequence != second_sequence
 
 
+class TestRandomGeneratorThreading:
+    """Test sharing a RandomGenerator between threads."""
+
+    def test_shared_generator_batches(self) -> None:
+        """Test that concurrent batch calls each draw a whole, uninterleaved batch."""
+        rg = RandomGenerator(seed=7)
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            batches = list(
+                executor.map(lambda _: tuple(rg.rand_ints(1, 100, 1000)), range(40))
+            )
+
+        reference = RandomGenerator(seed=7)
+        expected = [tuple(reference.rand_ints(1, 100, 1000)) for _ in range(40)]
+
+        assert Counter(batches) == Counter(expected)
+
+
 class TestShuffleContainer:
     """Test shuffle container functionality."""
 
@@ -299,14 +444,13 @@ class TestShuffleContainer:
         assert shuffled != original
 
         # Should contain all the same elements
-        assert sorted(shuffled) == sorted(original)
+        assert Counter(shuffled) == Counter(original)
 
-    def test_shuffle_container(self) -> None:
+    def test_shuffle_container(self, int_population: Container[int]) -> None:
         """Test shuffling container."""
-        data = list(range(1, 21))
-        container = Container(int, data)
+        container = int_population
 
-        shuffled = Container(int, data.copy())
+        shuffled = Container(int, container)
         shuffle(shuffled)
 
         # Size should remain the same
@@ -316,7 +460,7 @@ class TestShuffleContainer:
         assert shuffled != container
 
         # Should contain all the same elements
-        assert sorted(shuffled) == list(container)
+        assert Counter(shuffled.to_list()) == Counter(container.to_list())
 
     def test_shuffle_single_element(self) -> None:
         """Test shuffling single element."""
@@ -351,9 +495,12 @@ class TestSampleFromRange:
         for element in sample_result:
             assert element in population
 
-    def test_sample_from_container(self) -> None:
+        # Relative order of sampled elements should be preserved
+        assert sample_result == sorted(sample_result)
+
+    def test_sample_from_container(self, float_population: Container[float]) -> None:
         """Test sampling from a container."""
-        container = Container(float, [float(x) for x in range(1, 11)])
+        container = float_population
         sample_size = 5
 
         sample_result = sample(container, sample_size)
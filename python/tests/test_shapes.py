@@ -5,7 +5,13 @@ import math
 import pytest
 
 from demo.exceptions import ValidationException
-from demo.shapes import Circle, Rectangle, Shape
+from demo.shapes import Circle, CircleArray, Rectangle, RectangleArray, Shape
+
+
+@pytest.fixture(scope='class')
+def shapes() -> tuple[Circle, Rectangle, Rectangle]:
+    """Fixture for a circle, a rectangle and a square shared within a test class."""
+    return Circle(3.0), Rectangle(4.0, 5.0), Rectangle(2.0)
 
 
 class TestCircle:
@@ -17,7 +23,7 @@ class TestCircle:
 
         assert circle.radius == 5.0
 
-    @pytest.mark.parametrize('radius', [0.0, -3.0])
+    @pytest.mark.parametrize('radius', [0.0, -3.0], ids=['zero', 'negative'])
     def test_creation_with_invalid_radius(self, radius: float) -> None:
         """Test creation with invalid radius."""
         with pytest.raises(
@@ -92,8 +98,9 @@ class TestRectangle:
         'width, height',
         [
             (4.0, 6.0),
-            (5.0, None),  # square
+            (5.0, None),
         ],
+        ids=['rectangle', 'square'],
     )
     def test_creation(self, width: float, height: float | None) -> None:
         """Test creation."""
@@ -114,6 +121,7 @@ class TestRectangle:
             (-3.0, 5.0),
             (5.0, -3.0),
         ],
+        ids=['zero-width', 'zero-height', 'negative-width', 'negative-height'],
     )
     def test_creation_with_invalid_dimensions(
         self, width: float, height: float
@@ -128,8 +136,9 @@ class TestRectangle:
         'width, height',
         [
             (4.0, 6.0),
-            (5.0, None),  # square
+            (5.0, None),
         ],
+        ids=['rectangle', 'square'],
     )
     def test_get_area(self, width: float, height: float | None) -> None:
         """Test area calculation."""
@@ -145,8 +154,9 @@ class TestRectangle:
         'width, height',
         [
             (4.0, 6.0),
-            (5.0, None),  # square
+            (5.0, None),
         ],
+        ids=['rectangle', 'square'],
     )
     def test_get_perimeter(self, width: float, height: float | None) -> None:
         """Test perimeter calculation."""
@@ -228,31 +238,26 @@ class TestShapePolymorphism:
         assert issubclass(Circle, Shape)
         assert issubclass(Rectangle, Shape)
 
-    def test_polymorphic_behavior(self) -> None:
+    def test_polymorphic_behavior(
+        self, shapes: tuple[Circle, Rectangle, Rectangle]
+    ) -> None:
         """Test polymorphic behavior."""
-        circle = Circle(3.0)
-        rectangle = Rectangle(4.0, 5.0)
-        square = Rectangle(2.0)
-
-        shapes: list[Shape] = [circle, rectangle, square]
-        expected_results: list[tuple[type[Shape], float, float]] = [
-            (Circle, math.pi * 9.0, math.pi * 6.0),
-            (Rectangle, 20.0, 18.0),
-            (Rectangle, 4.0, 8.0),
-        ]
-
-        for shape, (cls, area, perimeter) in zip(
-            shapes, expected_results, strict=False
-        ):
+        expected_types: list[type[Shape]] = [Circle, Rectangle, Rectangle]
+        expected_results = [math.pi * 9.0, math.pi * 6.0, 20.0, 18.0, 4.0, 8.0]
+
+        results: list[float] = []
+        for shape, cls in zip(shapes, expected_types, strict=True):
             assert isinstance(shape, cls)
             assert isinstance(shape, Shape)
-            assert shape.get_area() == pytest.approx(area)
-            assert shape.get_perimeter() == pytest.approx(perimeter)
+            results += (shape.get_area(), shape.get_perimeter())
+
+        assert results == pytest.approx(expected_results)
 
-    def test_invalid_comparison(self) -> None:
+    def test_invalid_comparison(
+        self, shapes: tuple[Circle, Rectangle, Rectangle]
+    ) -> None:
         """Test invalid comparison between different shapes."""
-        circle = Circle(3.0)
-        rectangle = Rectangle(4.0, 5.0)
+        circle, rectangle, _ = shapes
 
         assert circle != rectangle
         assert not (circle == rectangle)
@@ -268,3 +273,62 @@ class TestShapePolymorphism:
 
         with pytest.raises(TypeError):
             _ = shape1 == shape2
+
+
+class TestShapeArrays:
+    """Test batch shape arrays."""
+
+    def test_circle_array(self) -> None:
+        """Test batch circle calculations match the single-shape results."""
+        radii = [1.0, 2.5, 5.0]
+        circles = CircleArray(radii)
+
+        assert len(circles) == 3
+        assert circles.areas() == [Circle(r).get_area() for r in radii]
+        assert circles.perimeters() == [Circle(r).get_perimeter() for r in radii]
+
+    def test_circle_array_with_invalid_radius(self) -> None:
+        """Test batch circle creation with invalid radius."""
+        with pytest.raises(
+            ValidationException, match='Circle radius must be positive'
+        ) as exc_info:
+            CircleArray([1.0, 0.0])
+
+        assert exc_info.value.field_name == 'radius'
+
+    def test_rectangle_array(self) -> None:
+        """Test batch rectangle calculations match the single-shape results."""
+        widths = [4.0, 2.0, 5.0]
+        heights = [3.0, 6.0, 5.0]
+        rectangles = RectangleArray(widths, heights)
+
+        assert len(rectangles) == 3
+        assert rectangles.areas() == [12.0, 12.0, 25.0]
+        assert rectangles.perimeters() == [14.0, 16.0, 20.0]
+
+    def test_rectangle_array_squares(self) -> None:
+        """Test batch rectangle creation with widths only."""
+        squares = RectangleArray([2.0, 3.0])
+
+        assert squares.areas() == [4.0, 9.0]
+        assert squares.perimeters() == [8.0, 12.0]
+
+    def test_dimensions_are_private(self) -> None:
+        """Test that batch dimensions cannot be replaced after validation."""
+        circles = CircleArray([1.0])
+        with pytest.raises(AttributeError):
+            circles.radii = [-1.0]  # type: ignore[attr-defined]
+
+        rectangles = RectangleArray([2.0])
+        with pytest.raises(AttributeError):
+            rectangles.widths = [-1.0]  # type: ignore[attr-defined]
+
+    def test_rectangle_array_with_invalid_dimensions(self) -> None:
+        """Test batch rectangle creation with invalid dimensions."""
+        with pytest.raises(ValueError, match='must have the same length'):
+            RectangleArray([1.0, 2.0], [1.0])
+
+        with pytest.raises(
+            ValidationException, match='Rectangle dimensions must be positive'
+        ):
+            RectangleArray([1.0, 2.0], [1.0, -2.0])
@@ -123,6 +123,16 @@ class TestScopedTimer:
 
         assert 100_000_000 <= elapsed_ns < 300_000_000
 
+    def test_context_manager_keeps_manual_stop(self) -> None:
+        """Test context manager exit does not override an explicit stop."""
+        with Timer() as timer:
+            sleep(0.01)
+            timer.stop()
+            stopped_ns = timer.elapsed_ns
+            sleep(0.01)
+
+        assert timer.elapsed_ns == stopped_ns
+
     def test_measure_time(self) -> None:
         """Test measure_time function."""
         with measure_time() as timer:
@@ -133,6 +143,16 @@ class TestScopedTimer:
 
         assert 100_000_000 <= elapsed_ns < 300_000_000
 
+    def test_measure_time_output(self, capsys: pytest.CaptureFixture[str]) -> None:
+        """Test measure_time prints the elapsed time on exit."""
+        with measure_time('Named scope'):
+            pass
+        assert capsys.readouterr().out.startswith('Named scope: ')
+
+        with measure_time():
+            pass
+        assert capsys.readouterr().out.startswith('Elapsed: ')
+
 
 class TestUtilityFunctions:
     """Test utility functions."""
@@ -175,6 +195,59 @@ class TestBenchmark:
         assert result.total_ns >= 50_000_000 * iterations
         assert 50_000_000 <= result.min_ns <= result.avg_ns <= result.max_ns
 
+    def test_benchmark_batch(self) -> None:
+        """Test benchmarking a fast function in batches."""
+        calls = 0
+
+        def task() -> None:
+            nonlocal calls
+            calls += 1
+
+        result = benchmark('Batched task', task, iterations=1000, batch=100)
+
+        assert calls == 1000
+        assert result.iterations == 1000
+        assert result.min_ns <= result.avg_ns <= result.max_ns
+        assert result.avg_ns <= result.total_ns // 100
+
+    def test_benchmark_batch_remainder(self) -> None:
+        """Test benchmarking a number of calls that is not a multiple of the batch."""
+        calls = 0
+
+        def task() -> None:
+            nonlocal calls
+            calls += 1
+
+        result = benchmark('Uneven batches', task, iterations=250, batch=100)
+
+        assert calls == 250
+        assert result.iterations == 250
+        assert result.min_ns <= result.avg_ns <= result.max_ns
+
+        calls = 0
+        result = benchmark('Oversized batch', task, iterations=1500, batch=2000)
+
+        assert calls == 1500
+        assert result.iterations == 1500
+
+    def test_benchmark_auto_batch(self) -> None:
+        """Test benchmarking with an automatically chosen batch size."""
+        result = benchmark(
+            'Auto-batched task', lambda: None, iterations=5000, batch=None
+        )
+
+        assert result.iterations == 5000
+        assert result.min_ns <= result.avg_ns <= result.max_ns
+
+        result = benchmark('Few iterations', lambda: None, iterations=10, batch=None)
+
+        assert result.iterations == 10
+
+    def test_benchmark_invalid_batch(self) -> None:
+        """Test benchmarking with an invalid batch size."""
+        with pytest.raises(ValueError, match='Batch size must be positive'):
+            benchmark('Invalid batch', lambda: None, batch=0)
+
     def test_print_result(self) -> None:
         """Test printing benchmark result."""
         result = benchmark('Test output', lambda: print('Test output'), iterations=5)
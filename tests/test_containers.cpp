@@ -38,6 +38,16 @@ TEST_CASE("Container basic operations", "[containers][basic]") {
     REQUIRE(container.size() == 5);
   }
 
+  SECTION("Vector construction") {
+    std::vector<std::string> source{"hello", "world"};
+    const auto *storage = source.data();
+    Container<std::string> container(std::move(source));
+
+    REQUIRE(container.GetSize() == 2);
+    REQUIRE(&*container.begin() == storage);
+    REQUIRE(container.At(0)->get() == "hello");
+  }
+
   SECTION("CTAD guide") {
     Container container{1, 2, 3, 4, 5};
 
@@ -4,6 +4,7 @@
 #include <cstddef>
 #include <cstdint>
 #include <cstdlib>
+#include <stdexcept>
 #include <string>
 #include <thread>
 #include <vector>
@@ -232,6 +233,21 @@ TEST_CASE("RandomGenerator boolean generation", "[random][generator][boolean]")
       REQUIRE(generator.GenerateBool(1.0));
     }
   }
+
+  SECTION("Boolean vector") {
+    constexpr std::size_t ITERATIONS = 1000;
+    constexpr double HIGH_PROBABILITY = 0.9;
+
+    auto flips = generator.GenerateBoolVector(HIGH_PROBABILITY, ITERATIONS);
+    REQUIRE(flips.size() == ITERATIONS);
+
+    auto true_count = static_cast<std::size_t>(std::ranges::count(flips, true));
+    REQUIRE(true_count > static_cast<std::size_t>(ITERATIONS * 0.7));  // At least 70%
+
+    REQUIRE(std::ranges::none_of(generator.GenerateBoolVector(0.0, ITERATIONS),
+                                 [](bool flip) { return flip; }));
+    REQUIRE_THROWS_AS(generator.GenerateBoolVector(1.5, ITERATIONS), std::invalid_argument);
+  }
 }
 
 TEST_CASE("RandomGenerator normal distribution", "[random][generator][normal]") {
@@ -277,6 +293,25 @@ TEST_CASE("RandomGenerator normal distribution", "[random][generator][normal]")
     REQUIRE(value < MEAN + (5.0 * STDDEV));
   }
 
+  SECTION("Normal distribution vector") {
+    constexpr double MEAN = 100.0;
+    constexpr double STDDEV = 15.0;
+    constexpr std::size_t COUNT = 1000;
+
+    auto values = generator.GenerateNormalVector(MEAN, STDDEV, COUNT);
+
+    REQUIRE(values.size() == COUNT);
+    double sum = 0.0;
+    for (const auto &value : values) {
+      sum += value;
+    }
+    double sample_mean = sum / static_cast<double>(COUNT);
+
+    // Sample mean should be close to theoretical mean (within 0.2 standard deviations)
+    REQUIRE(std::abs(sample_mean - MEAN) < 0.2 * STDDEV);
+    REQUIRE(generator.GenerateNormalVector(MEAN, STDDEV, 0).empty());
+  }
+
   SECTION("Float normal distribution") {
     constexpr float MEAN = 5.0F;
     constexpr float STDDEV = 0.1F;